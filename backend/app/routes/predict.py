@@ -4,10 +4,11 @@ from fastapi import APIRouter, HTTPException
 from fastapi.responses import JSONResponse, StreamingResponse
 from ..schemas import (
     PredictRequest, PredictResponse,
-    PredictBatchRequest, PredictBatchResponse
+    PredictBatchRequest, PredictBatchResponse,
+    TransientRequest, TransientResponse, TransientSnapshot
 )
 from ...engine import grid as gridmod
-from ...engine import jets, edt_adpi, compliance, optimizer, uncertainty as uncty
+from ...engine import jets, edt_adpi, compliance, optimizer, transient, uncertainty as uncty
 import numpy as np
 from ...reports import figures
 
@@ -17,11 +18,7 @@ def _clamp_grid_spacing(s: float) -> float:
     # prevent silly values: 0.02..1.0 m
     return float(min(1.0, max(0.02, s)))
 
-def _compute_metrics_and_artifacts(req: PredictRequest) -> PredictResponse:
-    # build grid
-    G = gridmod.Grid2D(req.room.length_m, req.room.width_m, spacing=_clamp_grid_spacing(req.solver.grid_spacing_m))
-
-    # diffuser locations
+def _diffuser_layout(req: PredictRequest, G):
     sel = req.diffusers.selection[0]
     count = int(sel.count)
     if req.solver.optimize_layout or not sel.existing_locations:
@@ -34,6 +31,15 @@ def _compute_metrics_and_artifacts(req: PredictRequest) -> PredictResponse:
             locs += optimizer.greedy_layout(G, count=count-len(locs),
                                             min_wall=req.diffusers.constraints.min_from_walls_m)
         used_manual = True
+    return locs, used_manual
+
+def _compute_metrics_and_artifacts(req: PredictRequest) -> PredictResponse:
+    # build grid
+    G = gridmod.Grid2D(req.room.length_m, req.room.width_m, spacing=_clamp_grid_spacing(req.solver.grid_spacing_m))
+
+    # diffuser locations
+    sel = req.diffusers.selection[0]
+    locs, used_manual = _diffuser_layout(req, G)
 
     total_cfm = float(req.ventilation.supply_total_cfm)
     per_cfm = total_cfm / max(1, len(locs))
@@ -125,6 +131,84 @@ def predict(req: PredictRequest):
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+def _simulate_transient(req: TransientRequest) -> TransientResponse:
+    G = gridmod.Grid2D(req.room.length_m, req.room.width_m, spacing=_clamp_grid_spacing(req.solver.grid_spacing_m))
+    sel = req.diffusers.selection[0]
+    locs, _ = _diffuser_layout(req, G)
+    returns = [(r["x"], r["y"]) for r in req.returns.locations]
+
+    tr = req.transient
+    dt_s = float(tr.dt_s)
+    n_steps = tr.n_steps
+    t_start = np.arange(n_steps) * dt_s
+
+    # expand the schedule to per-step arrays (values sampled at the start of each step)
+    steps = sorted(tr.schedule, key=lambda s: s.t_min)
+    starts = [60.0 * s.t_min for s in steps]
+    design_people = req.people.students + req.people.teachers
+    deltaT = transient.expand_schedule(t_start, starts, [s.deltaT_C for s in steps], req.loads.deltaT_C)
+    cfm = transient.expand_schedule(t_start, starts, [s.supply_total_cfm for s in steps],
+                                    req.ventilation.supply_total_cfm)
+    people = transient.expand_schedule(t_start, starts, [s.people for s in steps], design_people)
+
+    sim = transient.simulate(
+        G, locs, sel.model_id, dt_s, deltaT, cfm, people,
+        design_cfm=float(req.ventilation.supply_total_cfm),
+        design_people=design_people,
+        volume_m3=req.room.length_m * req.room.width_m * req.room.height_m,
+        returns=returns,
+        v95_target=req.comfort.v95_target_mps,
+        v95_blend=req.comfort.v95_blend,
+        Tmin=req.comfort.edt_min_C,
+        Tmax=req.comfort.edt_max_C,
+        vmax=req.comfort.v_cap_mps,
+        initial=tr.initial,
+        snapshot_every=tr.snapshot_every_steps,
+        snapshot_stride=tr.snapshot_stride,
+    )
+
+    t_end = (t_start + dt_s) / 60.0
+    adpi, draft = sim["adpi"], sim["draft_risk_area_pct"]
+
+    warnings = []
+    sign = -1.0 if req.loads.mode == "cooling" else 1.0
+    if np.any(deltaT * sign < 0.0):
+        warnings.append(f"deltaT_C sign inconsistent with {req.loads.mode} mode in part of the schedule")
+    if float(np.max(draft)) > 10.0:
+        warnings.append("High-velocity area >10% of occupied zone during part of the period")
+    if float(np.min(adpi)) < 0.8:
+        warnings.append("ADPI drops below 0.8 during part of the period")
+
+    return TransientResponse(
+        n_steps=n_steps,
+        dt_s=dt_s,
+        t_min=[round(float(t), 3) for t in t_end],
+        adpi=[round(float(a), 3) for a in adpi],
+        draft_risk_area_pct=[round(float(d), 2) for d in draft],
+        mean_temp_C=[round(float(t), 2) for t in sim["mean_temp_C"]],
+        summary={
+            "adpi_min": round(float(np.min(adpi)), 3),
+            "adpi_mean": round(float(np.mean(adpi)), 3),
+            "draft_risk_area_pct_max": round(float(np.max(draft)), 2),
+        },
+        snapshots=[TransientSnapshot(t_min=round(float(t_end[k]), 3),
+                                     temp_C=np.round(T, 2).tolist()) for (k, T) in sim["snapshots"]],
+        layout={
+            "diffusers": [{"x": x, "y": y} for (x,y) in locs],
+            "model": sel.model_id,
+            "returns": [{"x": x, "y": y} for (x,y) in returns]
+        },
+        warnings=warnings,
+        provenance={"engine_version": "0.1.1", "catalog_version": "v0", "assumption_preset": "K12_mixing_v1"},
+    )
+
+@router.post("/transient", response_model=TransientResponse)
+def predict_transient(req: TransientRequest):
+    try:
+        return _simulate_transient(req)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
 @router.post("/batch", response_model=PredictBatchResponse)
 def predict_batch(req: PredictBatchRequest):
     results = []
@@ -1,6 +1,7 @@
 # backend/app/schemas.py
-from pydantic import BaseModel, conlist, Field
-from typing import List, Optional, Literal, Dict, Any
+import math
+from pydantic import BaseModel, conlist, Field, model_validator
+from typing import List, Optional, Literal, Dict, Any, ClassVar
 
 class Room(BaseModel):
     length_m: float
@@ -24,7 +25,7 @@ class Standard(BaseModel):
     eca_target_cfm: Optional[float] = None
 
 class Ventilation(BaseModel):
-    supply_total_cfm: float
+    supply_total_cfm: float = Field(gt=0)
     infiltration_cfm: float = 0.0
 
 class DiffuserSel(BaseModel):
@@ -85,6 +86,65 @@ class PredictResponse(BaseModel):
     provenance: Dict[str, str]
     debug: Optional[Dict[str, Any]] = None
 
+class ScheduleStep(BaseModel):
+    # values hold from t_min until the next step; omitted fields keep the previous value
+    t_min: float
+    deltaT_C: Optional[float] = None
+    supply_total_cfm: Optional[float] = Field(default=None, gt=0)
+    people: Optional[int] = Field(default=None, ge=0)
+
+class Transient(BaseModel):
+    duration_min: float = Field(default=50.0, gt=0, le=480)
+    dt_s: float = Field(default=30.0, ge=1, le=600)
+    schedule: List[ScheduleStep] = []
+    initial: Literal["steady","uniform"] = "steady"
+    snapshot_every_min: Optional[float] = Field(default=None, gt=0, le=480,
+                                                description="If set, return the temperature field at this interval.")
+    snapshot_stride: int = Field(default=2, ge=1, le=50)  # keep every Nth cell in each direction
+
+    MAX_STEPS: ClassVar[int] = 5000
+    MAX_SNAPSHOTS: ClassVar[int] = 60
+
+    @property
+    def n_steps(self) -> int:
+        return max(1, int(round(self.duration_min * 60.0 / self.dt_s)))
+
+    @property
+    def snapshot_every_steps(self) -> int:
+        # 0 = no snapshots
+        if self.snapshot_every_min is None:
+            return 0
+        return max(1, int(round(self.snapshot_every_min * 60.0 / self.dt_s)))
+
+    @model_validator(mode="after")
+    def _check_size(self):
+        if self.n_steps > self.MAX_STEPS:
+            raise ValueError(f"duration_min/dt_s gives {self.n_steps} steps; at most {self.MAX_STEPS} allowed")
+        every = self.snapshot_every_steps
+        if every and math.ceil(self.n_steps / every) > self.MAX_SNAPSHOTS:
+            raise ValueError(f"snapshot_every_min gives more than {self.MAX_SNAPSHOTS} snapshots")
+        return self
+
+class TransientRequest(PredictRequest):
+    transient: Transient = Transient()
+
+class TransientSnapshot(BaseModel):
+    t_min: float
+    temp_C: List[List[float]]
+
+class TransientResponse(BaseModel):
+    n_steps: int
+    dt_s: float
+    t_min: List[float]
+    adpi: List[float]
+    draft_risk_area_pct: List[float]
+    mean_temp_C: List[float]
+    summary: Dict[str, float]
+    snapshots: List[TransientSnapshot]
+    layout: Dict[str, Any]
+    warnings: List[str]
+    provenance: Dict[str, str]
+
 class PredictBatchRequest(BaseModel):
     scenarios: List[PredictRequest]
 
@@ -18,6 +18,13 @@ def edt_field(Tx, Tr, Vmag):
     """
     return (Tx - Tr) - 8.0 * (Vmag - 0.15)
 
+def comfort_mask(Vmag, Tx, Tmin=-1.7, Tmax=1.1, vmax=0.35, Tr=24.0):
+    """
+    Cells that satisfy the ADPI comfort test (EDT within band and V below cap).
+    """
+    edt = edt_field(Tx, Tr, Vmag)
+    return (edt >= Tmin) & (edt <= Tmax) & (Vmag < vmax)
+
 def compute_metrics(Vmag, Tx, Tmin=-1.7, Tmax=1.1, vmax=0.35):
     """
     Evaluate comfort pass/fail and summary stats.
@@ -32,7 +39,7 @@ def compute_metrics(Vmag, Tx, Tmin=-1.7, Tmax=1.1, vmax=0.35):
     """
     Tr = 24.0
     edt = edt_field(Tx, Tr, Vmag)
-    pass_mask = (edt >= Tmin) & (edt <= Tmax) & (Vmag < vmax)
+    pass_mask = comfort_mask(Vmag, Tx, Tmin, Tmax, vmax, Tr=Tr)
 
     adpi = float(np.mean(pass_mask))
     pct_low = 100.0 * float(np.mean(Vmag < 0.05))    # stagnation area
@@ -24,42 +24,63 @@ def _interp_throw(model: dict, cfm: float, key: str="50") -> float:
                 break
     return val_ft * 0.3048  # ft → m
 
-def velocity_field(G, diffuser_locs, per_cfm, model_id, v95_target=None, v95_blend=1.0):
+def jet_geometry(G, diffuser_locs):
     """
-    Build a 2-D horizontal velocity field at occupied height from N ceiling diffusers.
+    Static per-diffuser geometry on the grid: squared radius and radial unit vectors.
 
-    Parameters
-    ----------
-    per_cfm : float   per-diffuser airflow [cfm]
-    v95_target : Optional[float]  If provided (e.g., 0.30), scale the field so that v95≈target.
-    v95_blend : float in [0..1]   1.0=full normalization; 0.5=halfway; 0.0=disabled.
+    Returns arrays shaped (n_diffusers, ny, nx) so fields for any airflow can be
+    rebuilt without recomputing distances (see `field_from_geometry`).
     """
-    model = _load_any_model(model_id)
+    locs = np.asarray(diffuser_locs, dtype=float).reshape(-1, 2)
+    dx = G.xx[None, :, :] - locs[:, 0, None, None]
+    dy = G.yy[None, :, :] - locs[:, 1, None, None]
+    r2 = dx*dx + dy*dy
+    norm = np.sqrt(r2) + 1e-6
+    return {"r2": r2, "ux": dx / norm, "uy": dy / norm}
+
+def jet_params(model: dict, per_cfm: float):
+    """Gaussian spread `sigma` [m] and centre amplitude `U0` [m/s] for one diffuser."""
     T50_m = _interp_throw(model, float(per_cfm), key="50")
 
     # crude Gaussian jet spread & amplitude
     sigma = max(0.6, 0.50 * T50_m)
     U0 = max(0.08, 0.00025 * float(per_cfm) + 0.05)
+    return sigma, U0
 
-    field = np.zeros((G.shape[0], G.shape[1], 2), dtype=float)
-    for (x0,y0) in diffuser_locs:
-        dx = G.xx - x0
-        dy = G.yy - y0
-        r2 = dx*dx + dy*dy
-        amp = U0 * np.exp(-r2/(2*sigma*sigma))
-        norm = np.sqrt(r2) + 1e-6
-        field[:,:,0] += amp * dx / norm
-        field[:,:,1] += amp * dy / norm
-
-    # optional: add one or more returns as sinks in the route via return_bias()
+def field_from_geometry(geom, sigma, U0):
+    """Superpose all diffuser jets for the given spread/amplitude -> (ny, nx, 2)."""
+    amp = U0 * np.exp(-geom["r2"] / (2*sigma*sigma))
+    return np.stack([(amp * geom["ux"]).sum(axis=0),
+                     (amp * geom["uy"]).sum(axis=0)], axis=2)
 
-    # normalize velocities so v95 ≈ v95_target (if provided)
+def v95_scale(field, v95_target=None, v95_blend=1.0):
+    """Multiplier that brings v95 of `field` toward `v95_target` (1.0 if disabled)."""
     if v95_target is not None and 0.0 <= v95_blend <= 1.0:
         Vmag = np.linalg.norm(field, axis=2)
         v95 = float(np.percentile(Vmag, 95))
         if v95 > 1e-6:
             scale = (v95_target / v95)
-            field *= ( (1.0 - v95_blend) + v95_blend * scale )
+            return (1.0 - v95_blend) + v95_blend * scale
+    return 1.0
+
+def velocity_field(G, diffuser_locs, per_cfm, model_id, v95_target=None, v95_blend=1.0):
+    """
+    Build a 2-D horizontal velocity field at occupied height from N ceiling diffusers.
+
+    Parameters
+    ----------
+    per_cfm : float   per-diffuser airflow [cfm]
+    v95_target : Optional[float]  If provided (e.g., 0.30), scale the field so that v95≈target.
+    v95_blend : float in [0..1]   1.0=full normalization; 0.5=halfway; 0.0=disabled.
+    """
+    model = _load_any_model(model_id)
+    sigma, U0 = jet_params(model, per_cfm)
+    field = field_from_geometry(jet_geometry(G, diffuser_locs), sigma, U0)
+
+    # optional: add one or more returns as sinks in the route via return_bias()
+
+    # normalize velocities so v95 ≈ v95_target (if provided)
+    field *= v95_scale(field, v95_target, v95_blend)
 
     return field
 
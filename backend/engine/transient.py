@@ -0,0 +1,111 @@
+# backend/engine/transient.py
+import numpy as np
+from . import jets, edt_adpi
+
+CFM_TO_M3S = 0.000471947
+RHO_CP = 1.2 * 1005.0          # air volumetric heat capacity [J/(m3·K)]
+Q_PERSON_W = 75.0              # sensible gain per seated occupant [W]
+MIN_ACH = 2.0                  # airflow floor for the occupancy term [air changes/h]
+MAX_OCC_SHIFT_C = 5.0          # cap on the occupancy shift of the room reference [K]
+
+def expand_schedule(times_s, starts_s, values, default):
+    """
+    Piecewise-constant lookup: value of the last segment starting at or before each time.
+
+    `values` entries of None hold the previous value (or `default` before the first one).
+    """
+    held, cur = [], default
+    for v in values:
+        if v is not None:
+            cur = v
+        held.append(cur)
+    if not held:
+        return np.full(len(times_s), float(default))
+    idx = np.searchsorted(np.asarray(starts_s, dtype=float), times_s, side="right") - 1
+    out = np.asarray(held, dtype=float)[np.clip(idx, 0, None)]
+    out[idx < 0] = float(default)
+    return out
+
+def simulate(G, diffuser_locs, model_id, dt_s, deltaT_C, supply_cfm, people, *,
+             design_cfm, design_people, volume_m3, returns=(),
+             v95_target=0.30, v95_blend=1.0,
+             Tmin=-1.7, Tmax=1.1, vmax=0.35, Tr=24.0,
+             initial="steady", snapshot_every=0, snapshot_stride=1):
+    """
+    Step a cell-wise temperature field through a class period.
+
+    Each cell relaxes toward the steady `local_temperature` of the current step
+    with the room air-change time constant V/Q (exact exponential update, so any
+    `dt_s` is stable). Occupancy above/below `design_people` shifts the room
+    reference temperature by the extra sensible gain carried off by the supply;
+    that shift uses at least `MIN_ACH` of airflow and is capped at
+    ±`MAX_OCC_SHIFT_C`, so very low airflows cannot give non-physical rises.
+
+    Diffuser geometry and the v95 scale are computed once at design airflow and
+    reused, so VAV turndown lowers velocities instead of being normalized away.
+    Velocity fields are cached per distinct airflow.
+
+    Parameters
+    ----------
+    deltaT_C, supply_cfm, people : array-like (nt,)  per-step schedule values
+    snapshot_every : int   keep the field every N steps (0 = none)
+    snapshot_stride : int  spatial downsampling of kept snapshots
+    """
+    deltaT_C = np.asarray(deltaT_C, dtype=float)
+    supply_cfm = np.asarray(supply_cfm, dtype=float)
+    people = np.asarray(people, dtype=float)
+    nt = len(deltaT_C)
+    n_diff = max(1, len(diffuser_locs))
+
+    model = jets._load_any_model(model_id)
+    geom = jets.jet_geometry(G, diffuser_locs)
+    bias = jets.return_bias(G, returns, strength=0.05) if returns else 0.0
+    scale = jets.v95_scale(
+        jets.field_from_geometry(geom, *jets.jet_params(model, design_cfm / n_diff)),
+        v95_target, v95_blend
+    )
+
+    cache = {}
+    def _speed(cfm):
+        key = round(float(cfm), 1)
+        if key not in cache:
+            field = jets.field_from_geometry(geom, *jets.jet_params(model, key / n_diff))
+            Vmag = np.linalg.norm(field * scale + bias, axis=2)
+            # local_temperature is affine in (Tr, deltaT): Tx = Tr + deltaT * cold
+            cold = edt_adpi.local_temperature(Vmag, Tr=0.0, deltaT_C=1.0)
+            cache[key] = (Vmag, cold, 100.0 * float(np.mean(Vmag > 0.25)))
+        return cache[key]
+
+    Q = np.maximum(supply_cfm, 1e-3) * CFM_TO_M3S
+    Q_occ = np.maximum(Q, MIN_ACH * float(volume_m3) / 3600.0)
+    shift = (people - float(design_people)) * Q_PERSON_W / (RHO_CP * Q_occ)
+    Tref = Tr + np.clip(shift, -MAX_OCC_SHIFT_C, MAX_OCC_SHIFT_C)
+    decay = np.exp(-float(dt_s) * Q / float(volume_m3))
+
+    adpi = np.empty(nt)
+    draft = np.empty(nt)
+    t_mean = np.empty(nt)
+    snapshots = []
+
+    if initial == "steady" and nt:
+        _, cold, _ = _speed(supply_cfm[0])
+        T = Tref[0] + deltaT_C[0] * cold
+    else:
+        T = np.full(G.shape, float(Tr))
+
+    for k in range(nt):
+        Vmag, cold, draft[k] = _speed(supply_cfm[k])
+        target = Tref[k] + deltaT_C[k] * cold
+        T = target + (T - target) * decay[k]
+        adpi[k] = np.mean(edt_adpi.comfort_mask(Vmag, T, Tmin, Tmax, vmax, Tr=Tr))
+        t_mean[k] = T.mean()
+        if snapshot_every and k % snapshot_every == 0:
+            snapshots.append((k, T[::snapshot_stride, ::snapshot_stride].copy()))
+
+    return {
+        "adpi": adpi,
+        "draft_risk_area_pct": draft,
+        "mean_temp_C": t_mean,
+        "snapshots": snapshots,
+        "n_velocity_fields": len(cache),
+    }
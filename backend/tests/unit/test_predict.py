@@ -0,0 +1,34 @@
+
+import json
+from backend.app.schemas import PredictRequest, TransientRequest
+from backend.app.routes.predict import _diffuser_layout, _simulate_transient
+from backend.engine.grid import Grid2D
+
+def _example():
+    with open("examples/request_classroom_30x25.json") as f:
+        return json.load(f)
+
+def test_diffuser_layout():
+    d = _example()
+    G = Grid2D(d["room"]["length_m"], d["room"]["width_m"])
+    locs, used_manual = _diffuser_layout(PredictRequest(**d), G)
+    assert len(locs) == 4 and not used_manual
+
+    d["solver"]["optimize_layout"] = False
+    d["diffusers"]["selection"][0]["existing_locations"] = [{"x": 2.0, "y": 2.0}]
+    locs, used_manual = _diffuser_layout(PredictRequest(**d), G)
+    assert used_manual and len(locs) == 4 and locs[0] == (2.0, 2.0)
+
+def test_transient_route():
+    d = _example()
+    d["transient"] = {"duration_min": 20, "dt_s": 60, "snapshot_every_min": 5, "snapshot_stride": 3,
+                      "schedule": [{"t_min": 10, "supply_total_cfm": 600}]}
+    r = _simulate_transient(TransientRequest(**d))
+    assert r.n_steps == 20 and len(r.adpi) == 20 and r.t_min[-1] == 20.0
+    assert len(r.snapshots) == 4 and len(r.snapshots[0].temp_C) == 5
+    assert r.draft_risk_area_pct[-1] <= r.draft_risk_area_pct[0]
+    assert not any("inconsistent" in w for w in r.warnings)
+
+    d["transient"]["schedule"].append({"t_min": 15, "deltaT_C": 4})
+    r = _simulate_transient(TransientRequest(**d))
+    assert any("inconsistent with cooling" in w for w in r.warnings)
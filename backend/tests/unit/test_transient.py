@@ -0,0 +1,90 @@
+
+import numpy as np
+import pytest
+from pydantic import ValidationError
+from backend.app.schemas import Ventilation, ScheduleStep, Transient
+from backend.engine import jets
+from backend.engine.edt_adpi import local_temperature, compute_metrics
+from backend.engine.grid import Grid2D
+from backend.engine.transient import expand_schedule, simulate, CFM_TO_M3S
+
+LOCS = [(3.0, 2.5), (6.0, 5.0)]
+VOL = 9.1 * 7.6 * 2.7
+
+def _run(G, n, dt=60.0, cfm=1200.0, people=29.0, deltaT=-8.0, **kw):
+    return simulate(G, LOCS, "example_square_cone", dt,
+                    np.full(n, deltaT), np.full(n, cfm), np.full(n, people),
+                    design_cfm=1200.0, design_people=29, volume_m3=VOL, **kw)
+
+def test_expand_schedule():
+    t = np.arange(5) * 60.0
+    assert expand_schedule(t, [60.0, 180.0], [5, None], 29).tolist() == [29, 5, 5, 5, 5]
+    assert expand_schedule(t, [60.0, 180.0], [None, 7], 29).tolist() == [29, 29, 29, 7, 7]
+    assert expand_schedule(t, [], [], 29).tolist() == [29] * 5
+
+def test_transient_relaxation():
+    G = Grid2D(9.1, 7.6)
+    field = jets.velocity_field(G, LOCS, 600.0, "example_square_cone", v95_target=0.30)
+    target = local_temperature(np.linalg.norm(field, axis=2), Tr=24.0, deltaT_C=-8.0)
+    decay = np.exp(-60.0 * 1200.0 * CFM_TO_M3S / VOL)
+
+    r = _run(G, 1, initial="uniform", snapshot_every=1)
+    _, T1 = r["snapshots"][0]
+    assert np.allclose(T1, target + (24.0 - target) * decay)
+
+    r = _run(G, 1, dt=600.0 * 20, initial="uniform", snapshot_every=1)
+    assert np.allclose(r["snapshots"][0][1], target, atol=1e-6)
+
+def test_transient_design_matches_static():
+    G = Grid2D(9.1, 7.6)
+    returns = [(4.6, 3.8)]
+    field = jets.velocity_field(G, LOCS, 600.0, "example_square_cone", v95_target=0.30)
+    Vmag = np.linalg.norm(field + jets.return_bias(G, returns), axis=2)
+    static = compute_metrics(Vmag, local_temperature(Vmag, Tr=24.0, deltaT_C=-8.0))
+
+    r = _run(G, 10, returns=returns)
+    assert np.allclose(r["adpi"], static["adpi"])
+    assert np.allclose(r["draft_risk_area_pct"], static["draft_risk_area_pct"])
+
+def test_transient_occupancy_warms():
+    G = Grid2D(9.1, 7.6)
+    design = _run(G, 10)
+    crowded = _run(G, 10, people=39.0)
+    assert np.all(crowded["mean_temp_C"] > design["mean_temp_C"])
+
+def test_transient_turndown():
+    G = Grid2D(9.1, 7.6)
+    t = np.arange(20) * 60.0
+    cfm = expand_schedule(t, [0.0, 600.0], [1200.0, 600.0], 1200.0)
+    n = len(t)
+    r = simulate(G, LOCS, "example_square_cone", 60.0,
+                 np.full(n, -8.0), cfm, np.full(n, 29.0),
+                 design_cfm=1200.0, design_people=29, volume_m3=VOL,
+                 snapshot_every=5, snapshot_stride=2)
+    assert r["adpi"].shape == (n,)
+    assert np.all((r["adpi"] >= 0) & (r["adpi"] <= 1))
+    assert r["draft_risk_area_pct"][-1] <= r["draft_risk_area_pct"][0]
+    assert r["n_velocity_fields"] == 2
+    assert len(r["snapshots"]) == 4
+
+def test_transient_low_airflow_bounded():
+    G = Grid2D(9.1, 7.6)
+    for cfm in (0.0, 1.0, 50.0):
+        r = _run(G, 10, cfm=cfm, people=5.0)
+        assert np.all(np.isfinite(r["mean_temp_C"]))
+        assert np.all(np.abs(r["mean_temp_C"] - 24.0) <= 8.0 + 5.0)
+
+def test_zero_airflow_rejected():
+    with pytest.raises(ValidationError):
+        Ventilation(supply_total_cfm=0)
+    with pytest.raises(ValidationError):
+        ScheduleStep(t_min=10, supply_total_cfm=0)
+
+def test_transient_limits():
+    assert Transient().n_steps == 100
+    for bad in ({"duration_min": 0}, {"duration_min": 1e6}, {"dt_s": 0},
+                {"snapshot_every_min": -1}, {"snapshot_stride": 0},
+                {"duration_min": 480, "dt_s": 1},
+                {"duration_min": 120, "dt_s": 30, "snapshot_every_min": 0.5}):
+        with pytest.raises(ValidationError):
+            Transient(**bad)